@@ -1,7 +1,7 @@
 """Module containing the low-level Sparkplug B client"""
 
 import logging
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Iterable, Optional, Union
 
 from paho.mqtt import client as paho_mqtt
 
@@ -14,7 +14,7 @@ from pysparkplug._constants import (
 )
 from pysparkplug._enums import ErrorCode, MQTTProtocol, QoS, Transport
 from pysparkplug._error import check_connack_code, check_error_code
-from pysparkplug._message import Message
+from pysparkplug._message import Message, _parse_topic
 from pysparkplug._payload import Birth
 from pysparkplug._topic import Topic
 from pysparkplug._types import Self
@@ -205,6 +205,23 @@ class Client:
         )
         check_error_code(result.rc)
 
+    def publish_many(
+        self,
+        messages: Iterable[Message],
+        *,
+        include_dtypes: bool = False,
+    ) -> None:
+        """Publish several messages to the broker, one MQTT publish per message
+
+        Args:
+            messages:
+                the messages to be published, in order
+            include_dtypes:
+                whether or not to include the dtypes of the messages
+        """
+        for message in messages:
+            self.publish(message, include_dtypes=include_dtypes)
+
     def subscribe(
         self,
         topic: Topic,
@@ -235,7 +252,7 @@ class Client:
         self._subscribe(topic, qos)
 
     def _handle_message(self, mqtt_message: paho_mqtt.MQTTMessage) -> Message:
-        topic = Topic.from_str(mqtt_message.topic)
+        topic = _parse_topic(mqtt_message.topic)
         key = (topic.group_id, topic.edge_node_id, topic.device_id)
         birth = self._births.get(key)
         message = Message.from_mqtt_message(mqtt_message, birth=birth, use_json_payload=self.use_json_payload)
@@ -1,7 +1,7 @@
 from __future__ import annotations
  
 import logging
-from typing import Callable, Optional, Dict, Tuple, List
+from typing import Callable, Optional, Dict, Iterable, Tuple, List
  
 from pysparkplug._client import Client
 from pysparkplug._constants import (
@@ -31,9 +31,13 @@ class DataOpsNode:
     _connected: bool = False
     _message_callback: Callable[[Self, Message], None]
  
-    # Internal state to track published metrics for each topic
-    _published_metrics: Dict[Tuple[str, str], Dict[str, Metric]]
+    # Internal state to track published metrics for each topic, stored as the
+    # metrics in NBIRTH order alongside an index of metric name -> position
+    _published_metrics: Dict[Tuple[str, str], Tuple[List[Metric], Dict[str, int]]]
+    _nbirth_topics: Dict[Tuple[str, str], Topic]
+    _ndeath_topics: Dict[Tuple[str, str], Topic]
     _retain_birth_certificates: bool = False
+    _timestamp_provider: Callable[[], int]
  
     def __init__(
         self,
@@ -41,12 +45,16 @@ class DataOpsNode:
         client: Optional[Client] = None,
         message_callback: Callable[[Self, Message], None] = _default_message_callback,
         retain_birth_certificates: bool = False,
+        timestamp_provider: Callable[[], int] = get_current_timestamp,
     ):
         self.node_id = node_id
         self._client = client if client else Client()
         self._message_callback = message_callback
         self._published_metrics = {}
+        self._nbirth_topics = {}
+        self._ndeath_topics = {}
         self._retain_birth_certificates = retain_birth_certificates
+        self._timestamp_provider = timestamp_provider
  
     def connect(
         self,
@@ -63,9 +71,10 @@ class DataOpsNode:
             self._connected = True
             logger.info(f"[DataOpsNode:{self.node_id}] Connected to broker.")
  
-            # Publish NBIRTH messages for all known topics
-            for (group_id, edge_node_id), metrics in self._published_metrics.items():
-                self._publish_nbirth(group_id, edge_node_id, metrics.values())
+            # Publish NBIRTH messages for all known topics, sharing one timestamp
+            timestamp = self._timestamp_provider()
+            for (group_id, edge_node_id), (metrics, _) in self._published_metrics.items():
+                self._publish_nbirth(group_id, edge_node_id, metrics, timestamp=timestamp)
  
         self._client.connect(
             host,
@@ -79,8 +88,9 @@ class DataOpsNode:
     def disconnect(self) -> None:
         """Publish NDEATH for all known topics and disconnect cleanly."""
         if self._connected:
-            for (group_id, edge_node_id), _ in self._published_metrics.items():
-                self._publish_ndeath(group_id, edge_node_id)
+            timestamp = self._timestamp_provider()
+            for group_id, edge_node_id in self._published_metrics:
+                self._publish_ndeath(group_id, edge_node_id, timestamp=timestamp)
  
         self._client.disconnect()
         self._connected = False
@@ -121,16 +131,15 @@ class DataOpsNode:
  
         if key not in self._published_metrics:
             # First-time publish for this topic, trigger NBIRTH
-            self._published_metrics[key] = {metric.name: metric for metric in metrics}
+            self._remember_metrics(key, metrics)
             self._publish_nbirth(group_id, edge_node_id, metrics)
         else:
             # Update internal metric state
-            for metric in metrics:
-                self._published_metrics[key][metric.name] = metric
+            self._remember_metrics(key, metrics)
  
             # Publish NDATA update
             payload = NData(
-                timestamp=get_current_timestamp(),
+                timestamp=self._timestamp_provider(),
                 seq=0,  # Simple seq handling; adjust if needed
                 metrics=metrics,
             )
@@ -138,42 +147,104 @@ class DataOpsNode:
             self._client.publish(message, include_dtypes=True)
             logger.info(f"[DataOpsNode:{self.node_id}] Published NDATA to topic: {topic}")
  
+    def publish_batch(
+        self,
+        topic: Topic,
+        metric_batches: Iterable[List[Metric]],
+        *,
+        qos: QoS = QoS.AT_MOST_ONCE,
+        retain: bool = False,
+    ) -> None:
+        """Coalesce several metric updates for one topic into a single NBIRTH/NDATA publish."""
+        metrics = [metric for batch in metric_batches for metric in batch]
+        if not metrics:
+            return
+ 
+        group_id = topic.group_id
+        edge_node_id = topic.edge_node_id
+        key = (group_id, edge_node_id)
+ 
+        if key not in self._published_metrics:
+            # First-time publish for this topic, trigger NBIRTH with the latest value per metric
+            self._remember_metrics(key, metrics)
+            self._publish_nbirth(group_id, edge_node_id, self._published_metrics[key][0])
+            return
+ 
+        self._remember_metrics(key, metrics)
+ 
+        payload = NData(
+            timestamp=self._timestamp_provider(),
+            seq=0,  # Simple seq handling; adjust if needed
+            metrics=tuple(metrics),
+        )
+        message = Message(topic=topic, payload=payload, qos=qos, retain=retain)
+        self._client.publish(message, include_dtypes=True)
+        logger.info(f"[DataOpsNode:{self.node_id}] Published batched NDATA ({len(metrics)} metrics) to topic: {topic}")
+ 
     def rebirth(self, group_id: str, edge_node_id: str) -> None:
         """Manually trigger rebirth (NBIRTH) for a known topic."""
         key = (group_id, edge_node_id)
-        metrics = self._published_metrics.get(key)
+        known = self._published_metrics.get(key)
  
-        if metrics:
-            self._publish_nbirth(group_id, edge_node_id, metrics.values())
+        if known and known[0]:
+            self._publish_nbirth(group_id, edge_node_id, known[0])
             logger.info(f"[DataOpsNode:{self.node_id}] Triggered rebirth for {group_id}/{edge_node_id}")
         else:
             logger.warning(f"[DataOpsNode:{self.node_id}] No metrics known for {group_id}/{edge_node_id}, cannot rebirth.")
  
-    def _publish_nbirth(self, group_id: str, edge_node_id: str, metrics: Iterable[Metric]) -> None:
+    def _remember_metrics(self, key: Tuple[str, str], metrics: Iterable[Metric]) -> None:
+        """Helper to record the latest value of each metric published for a topic."""
+        known = self._published_metrics.get(key)
+        if known is None:
+            known = self._published_metrics[key] = ([], {})
+        known_metrics, index = known
+        for metric in metrics:
+            position = index.get(metric.name)
+            if position is None:
+                index[metric.name] = len(known_metrics)
+                known_metrics.append(metric)
+            else:
+                known_metrics[position] = metric
+ 
+    def _publish_nbirth(
+        self,
+        group_id: str,
+        edge_node_id: str,
+        metrics: Iterable[Metric],
+        *,
+        timestamp: Optional[int] = None,
+    ) -> None:
         """Helper to publish NBIRTH."""
-        topic = Topic(
-            message_type=MessageType.NBIRTH,
-            group_id=group_id,
-            edge_node_id=edge_node_id,
-        )
+        key = (group_id, edge_node_id)
+        topic = self._nbirth_topics.get(key)
+        if topic is None:
+            topic = self._nbirth_topics[key] = Topic(
+                message_type=MessageType.NBIRTH,
+                group_id=group_id,
+                edge_node_id=edge_node_id,
+            )
         payload = NBirth(
-            timestamp=get_current_timestamp(),
+            timestamp=timestamp if timestamp is not None else self._timestamp_provider(),
             seq=0,  # Simple seq handling; adjust as necessary
-            metrics=list(metrics),
+            # Copied, since callers pass the node's live list of known metrics
+            metrics=tuple(metrics),
         )
         message = Message(topic=topic, payload=payload, qos=QoS.AT_MOST_ONCE, retain=self._retain_birth_certificates)
         self._client.publish(message, include_dtypes=True)
         logger.info(f"[DataOpsNode:{self.node_id}] Published NBIRTH to {group_id}/{edge_node_id}")
  
-    def _publish_ndeath(self, group_id: str, edge_node_id: str) -> None:
+    def _publish_ndeath(self, group_id: str, edge_node_id: str, *, timestamp: Optional[int] = None) -> None:
         """Helper to publish NDEATH."""
-        topic = Topic(
-            message_type=MessageType.NDEATH,
-            group_id=group_id,
-            edge_node_id=edge_node_id,
-        )
+        key = (group_id, edge_node_id)
+        topic = self._ndeath_topics.get(key)
+        if topic is None:
+            topic = self._ndeath_topics[key] = Topic(
+                message_type=MessageType.NDEATH,
+                group_id=group_id,
+                edge_node_id=edge_node_id,
+            )
         payload = NDeath(
-            timestamp=get_current_timestamp(),
+            timestamp=timestamp if timestamp is not None else self._timestamp_provider(),
             bd_seq_metric=None,
         )
         message = Message(topic=topic, payload=payload, qos=QoS.AT_MOST_ONCE, retain=False)
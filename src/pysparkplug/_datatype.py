@@ -188,10 +188,13 @@ def _encode_boolean_array(bools: tuple[bool, ...]) -> bytes:
     return first_byte + int_value.to_bytes(num_bytes, byteorder="big")
 
 
+# Bit masks for each bit of a byte, most significant bit first
+_BIT_MASKS = tuple(1 << ind for ind in range(8))[::-1]
+
+
 def _decode_boolean_array(data: bytes) -> tuple[bool, ...]:
     num_bits = int.from_bytes(data[:4], "little")
-    masks = tuple(1 << ind for ind in range(8))[::-1]
-    return tuple(bool(byte & mask) for byte in data[4:] for mask in masks)[:num_bits]
+    return tuple([bool(byte & mask) for byte in data[4:] for mask in _BIT_MASKS][:num_bits])
 
 
 _encoders = {
@@ -231,7 +234,7 @@ _encoders = {
     DataType.STRING_ARRAY: lambda val: b"\0".join(s.encode("utf-8") for s in val)
     + b"\0",
     DataType.DATETIME_ARRAY: lambda val: _encode_numeric_array(
-        tuple(int(v.timestamp() * 1000) for v in val), "Q"
+        [int(v.timestamp() * 1000) for v in val], "Q"
     ),
 }
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Mapping, Optional
 
 from pysparkplug._client import Client
 from pysparkplug._constants import (
@@ -32,6 +33,18 @@ def _default_message_callback(_: "HostApplication", message: Message) -> None:
         logger.info(f"[Host] Received message: {message}")
 
 
+@functools.lru_cache(maxsize=1024)
+def _host_state_topic(host_id: str) -> Topic:
+    """STATE topic for a Host under any group, used to watch its own state"""
+    return Topic(message_type=MessageType.STATE, group_id=SINGLE_LEVEL_WILDCARD, sparkplug_host_id=host_id)
+
+
+@functools.lru_cache(maxsize=1024)
+def _host_own_state_topic(host_id: str) -> Topic:
+    """STATE topic a Host publishes its own online/offline status to"""
+    return Topic(message_type=MessageType.STATE, sparkplug_host_id=host_id)
+
+
 class HostApplication:
     """Class representing a Sparkplug Host Application.
 
@@ -48,6 +61,9 @@ class HostApplication:
         message_callback:
             A callback invoked whenever *any* Sparkplug message is received. In a Host,
             you typically handle births, data updates, etc., in this callback.
+        subscribe_own_state:
+            Whether to subscribe to this Host's own STATE topic, e.g. to watch its
+            own birth/death for debugging. Off by default to save a SUBSCRIBE per Host.
     """
 
     host_id: str
@@ -62,6 +78,7 @@ class HostApplication:
         client: Optional[Client] = None,
         message_callback: Callable[[Self, Message], None] = _default_message_callback,
         retain_birth_certificates: bool = False,
+        subscribe_own_state: bool = False,
     ):
         self.host_id = host_id
         self._client = client if client is not None else Client()
@@ -70,11 +87,12 @@ class HostApplication:
         # Subscribe to all "Host State" messages about ourselves if desired.
         # (Some users do this for debugging or to watch their own birth/death,
         # but it is optional.)
-        self.subscribe(
-            topic=Topic(message_type=MessageType.STATE, group_id=SINGLE_LEVEL_WILDCARD, sparkplug_host_id=self.host_id),
-            qos=QoS.AT_LEAST_ONCE,
-            callback=self._message_callback,
-        )
+        if subscribe_own_state:
+            self.subscribe(
+                topic=_host_state_topic(self.host_id),
+                qos=QoS.AT_LEAST_ONCE,
+                callback=self._message_callback,
+            )
 
     def _setup_will(self) -> None:
         """Set the Host's 'last will' STATE message.
@@ -82,7 +100,7 @@ class HostApplication:
         If this HostApplication disconnects unexpectedly, the broker
         will automatically publish this will indicating the Host is offline.
         """
-        will_topic = Topic(message_type=MessageType.STATE, sparkplug_host_id=self.host_id)
+        will_topic = _host_own_state_topic(self.host_id)
         will_payload = State(timestamp=get_current_timestamp(), online=False)
         will_message = Message(topic=will_topic, payload=will_payload, qos=QoS.AT_MOST_ONCE, retain=True)
         self._client.set_will(will_message)
@@ -119,7 +137,7 @@ class HostApplication:
         def on_connect_callback(client: Client) -> None:
             self._connected = True
             # Publish STATE that the Host is online
-            online_topic = Topic(message_type=MessageType.STATE, sparkplug_host_id=self.host_id) #could make a conflict with the subscription 
+            online_topic = _host_own_state_topic(self.host_id) #could make a conflict with the subscription 
             online_payload = State(timestamp=get_current_timestamp(), online=True)
             online_message = Message(topic=online_topic, payload=online_payload, qos=QoS.AT_LEAST_ONCE, retain=True)
             client.publish(online_message)
@@ -142,7 +160,7 @@ class HostApplication:
     def disconnect(self) -> None:
         """Gracefully disconnect from the broker, publishing a final offline STATE."""
         if self._connected:
-            offline_topic = Topic(message_type=MessageType.STATE, sparkplug_host_id=self.host_id)
+            offline_topic = _host_own_state_topic(self.host_id)
             offline_payload = State(timestamp=get_current_timestamp(), online=False)
             offline_message = Message(topic=offline_topic, payload=offline_payload, qos=QoS.AT_MOST_ONCE, retain=True)
             self._client.publish(offline_message)
@@ -250,6 +268,84 @@ class HostApplication:
         msg = Message(topic=topic, payload=payload, qos=qos, retain=retain)
         self._client.publish(msg, include_dtypes=True)
 
+    def send_node_commands(
+        self,
+        commands: Mapping[str, Iterable[Metric]],
+        *,
+        group_id: str,
+        qos: QoS = QoS.AT_LEAST_ONCE,
+        retain: bool = False,
+    ) -> None:
+        """Send an NCMD to each of several Edge Nodes, one publish per node.
+
+        Args:
+            commands:
+                A mapping of target Edge Node ID to the list of Metric objects
+                to send in that node's NCMD.
+            group_id:
+                The group the Edge Nodes belong to.
+            qos:
+                Publish QoS level.
+            retain:
+                Whether to retain the messages on the broker.
+        """
+        timestamp = get_current_timestamp()
+        messages = [
+            Message(
+                topic=Topic(
+                    message_type=MessageType.NCMD,
+                    group_id=group_id,
+                    edge_node_id=edge_node_id,
+                ),
+                payload=NCmd(timestamp=timestamp, metrics=tuple(metrics)),
+                qos=qos,
+                retain=retain,
+            )
+            for edge_node_id, metrics in commands.items()
+        ]
+        self._client.publish_many(messages, include_dtypes=True)
+
+    def send_device_commands(
+        self,
+        edge_node_id: str,
+        commands: Mapping[str, Iterable[Metric]],
+        *,
+        group_id: str,
+        qos: QoS = QoS.AT_MOST_ONCE,
+        retain: bool = False,
+    ) -> None:
+        """Send a DCMD to each of several Devices under an Edge Node, one publish per device.
+
+        Args:
+            edge_node_id:
+                The parent node's unique ID.
+            commands:
+                A mapping of target Device ID to the list of Metric objects
+                to send in that device's DCMD.
+            group_id:
+                The group the Edge Node belongs to.
+            qos:
+                Publish QoS level.
+            retain:
+                Whether to retain the messages on the broker.
+        """
+        timestamp = get_current_timestamp()
+        messages = [
+            Message(
+                topic=Topic(
+                    message_type=MessageType.DCMD,
+                    group_id=group_id,
+                    edge_node_id=edge_node_id,
+                    device_id=device_id,
+                ),
+                payload=DCmd(timestamp=timestamp, metrics=tuple(metrics)),
+                qos=qos,
+                retain=retain,
+            )
+            for device_id, metrics in commands.items()
+        ]
+        self._client.publish_many(messages, include_dtypes=True)
+
     @property
     def connected(self) -> bool:
         """Returns whether this HostApplication is connected to the broker."""
@@ -257,20 +353,48 @@ class HostApplication:
 
 
 def get_topic_hierarchy_from_spb_parris_encoding(message: Message, metric: Metric) -> list[str]:
-    if not message.topic.namespace == "spBv1.0":
-        raise ValueError(f"Unsupported namespace: {message.topic.namespace}")
-    
-    topic_hierarchy = message.topic.group_id.split(":")
-    
-    if message.topic.edge_node_id is not None and message.topic.sparkplug_host_id is not None:
+    topic = message.topic
+    return list(
+        _build_hierarchy(
+            topic.namespace,
+            topic.group_id,
+            topic.edge_node_id,
+            topic.sparkplug_host_id,
+            topic.device_id,
+            metric.name,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_hierarchy(
+    namespace: str,
+    group_id: str,
+    edge_node_id: Optional[str],
+    sparkplug_host_id: Optional[str],
+    device_id: Optional[str],
+    metric_name: str,
+) -> tuple[str, ...]:
+    """Build the Parris-encoded hierarchy for a topic/metric pair.
+
+    Hosts see the same handful of topic and metric name combinations over and
+    over, so results are memoized; they are returned as tuples so the cached
+    value can't be mutated by callers.
+    """
+    if namespace != "spBv1.0":
+        raise ValueError(f"Unsupported namespace: {namespace}")
+
+    topic_hierarchy = group_id.split(":")
+
+    if edge_node_id is not None and sparkplug_host_id is not None:
         raise ValueError("Edge Node and Host ID are mutually exclusive.")
-    elif message.topic.edge_node_id is not None:
-        topic_hierarchy.append(message.topic.edge_node_id)
-        if message.topic.device_id is not None:
-            topic_hierarchy.append(message.topic.device_id)
-    elif message.topic.sparkplug_host_id is not None:
-        topic_hierarchy.append(message.topic.sparkplug_host_id)
-    
-    topic_hierarchy.extend(metric.name.split(":"))
-    
-    return topic_hierarchy
+    elif edge_node_id is not None:
+        topic_hierarchy.append(edge_node_id)
+        if device_id is not None:
+            topic_hierarchy.append(device_id)
+    elif sparkplug_host_id is not None:
+        topic_hierarchy.append(sparkplug_host_id)
+
+    topic_hierarchy.extend(metric_name.split(":"))
+
+    return tuple(topic_hierarchy)
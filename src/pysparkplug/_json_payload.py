@@ -2,136 +2,270 @@
 
 from __future__ import annotations
 
+import base64
+import dataclasses
 import json
 import logging
+import math
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from pysparkplug._datatype import DataType
+from pysparkplug._metadata import Metadata
 from pysparkplug._metric import Metric
+from pysparkplug._protobuf import DataSet, DataSetValue, Parameter, Row, Template
 from pysparkplug._types import Self
 
-def metric_to_json(metric: Metric, *, include_dtype: bool = False) -> Dict[str, Any]:
+
+def _stdlib_json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes"""
+    # Non-finite floats are written explicitly by the value encoders below, so
+    # anything left over is rejected rather than written as a NaN/Infinity literal
+    return json.dumps(
+        data, allow_nan=False, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def _stdlib_json_loads(raw: bytes) -> Any:
+    """Deserialize JSON bytes"""
+    return json.loads(raw)
+
+
+# orjson is an optional extra, i.e. pip install pysparkplug[orjson]; payloads
+# written by either backend decode to the same values with either backend
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    json_dumps = _stdlib_json_dumps
+    json_loads = _stdlib_json_loads
+else:
+    json_dumps = orjson.dumps
+
+    def json_loads(raw: bytes) -> Any:
+        """Deserialize JSON bytes"""
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Stdlib json encoders, including older releases of this package,
+            # may write NaN/Infinity literals, which orjson refuses to parse
+            return _stdlib_json_loads(raw)
+
+# JSON has no literal for NaN/Infinity, so those floats are written as strings
+_NON_FINITE_FLOATS = {"NaN": math.nan, "Infinity": math.inf, "-Infinity": -math.inf}
+_FLOAT_FIELDS = frozenset({"float_value", "double_value"})
+
+def _identity(value: Any) -> Any:
+    return value
+
+def _float_to_json(value: float) -> Any:
+    if math.isfinite(value):
+        return value
+    if math.isnan(value):
+        return "NaN"
+    return "Infinity" if value > 0 else "-Infinity"
+
+def _float_from_json(value: Any) -> float:
+    if isinstance(value, str):
+        return _NON_FINITE_FLOATS[value]
+    return value
+
+def _float_array_to_json(value: Any) -> list[Any]:
+    return [_float_to_json(v) for v in value]
+
+def _float_array_from_json(value: Any) -> tuple[float, ...]:
+    return tuple([_float_from_json(v) for v in value])
+
+def _untyped_to_json(value: Any) -> Any:
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Non-finite value {value} requires a FLOAT or DOUBLE datatype")
+    return value
+
+def _metadata_to_json(metadata: Metadata) -> Dict[str, Any]:
+    values = ((field.name, getattr(metadata, field.name)) for field in dataclasses.fields(metadata))
+    return {name: value for name, value in values if value is not None}
+
+def _bytes_to_json(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+def _bytes_from_json(value: Any) -> bytes:
+    # Older encoders wrote bytes as a list of ints rather than base64
+    if isinstance(value, list):
+        return bytes(value)
+    return base64.b64decode(value)
+
+def _dataset_to_json(value: Any) -> Dict[str, Any]:
+    # Each column's cells all live in the same oneof field, so resolve it once
+    # per column rather than asking every cell which field it has set
+    fields = [DataType(col_type).field for col_type in value.types]
+    converters = [_float_to_json if field in _FLOAT_FIELDS else _identity for field in fields]
+    return {
+        "num_of_columns": value.num_of_columns,
+        "columns": list(value.columns),
+        "types": list(value.types),
+        "rows": [
+            [
+                convert(getattr(cell, field)) if cell.HasField(field) else None
+                for field, convert, cell in zip(fields, converters, row.elements)
+            ]
+            for row in value.rows
+        ]
+    }
+
+def _parameter_to_json(param: Any) -> Dict[str, Any]:
+    field = DataType(param.type).field
+    return {
+        "name": param.name,
+        "type": param.type,
+        "value": (
+            (_float_to_json if field in _FLOAT_FIELDS else _identity)(getattr(param, field))
+            if param.HasField(field)
+            else None
+        ),
+    }
+
+def _template_to_json(value: Any) -> Dict[str, Any]:
+    return {
+        "version": value.version,
+        "template_ref": value.template_ref,
+        "is_definition": value.is_definition,
+        "metrics": [metric_to_json(Metric.from_pb(m)) for m in value.metrics],
+        "parameters": [_parameter_to_json(p) for p in value.parameters]
+    }
+
+def _dataset_from_json(value: Dict[str, Any]) -> Any:
+    fields = [DataType(col_type).field for col_type in value["types"]]
+    converters = [_float_from_json if field in _FLOAT_FIELDS else _identity for field in fields]
+    dataset = DataSet(
+        num_of_columns=value["num_of_columns"],
+        columns=value["columns"],
+        types=value["types"],
+    )
+    dataset.rows.extend(
+        Row(
+            elements=[
+                DataSetValue(**{field: convert(cell_value)}) if cell_value is not None else DataSetValue()
+                for field, convert, cell_value in zip(fields, converters, row_data)
+            ]
+        )
+        for row_data in value["rows"]
+    )
+    return dataset
+
+def _parameter_from_json(data: Dict[str, Any]) -> Any:
+    param = Parameter(name=data["name"], type=data["type"])
+    if data["value"] is not None:
+        field = DataType(data["type"]).field
+        value = _float_from_json(data["value"]) if field in _FLOAT_FIELDS else data["value"]
+        setattr(param, field, value)
+    return param
+
+def _template_from_json(value: Dict[str, Any]) -> Any:
+    return Template(
+        version=value["version"],
+        template_ref=value["template_ref"],
+        is_definition=value["is_definition"],
+        metrics=[metric_from_json(m).to_pb(include_dtype=True) for m in value["metrics"]],
+        parameters=[_parameter_from_json(p) for p in value["parameters"]],
+    )
+
+# Per-datatype conversions of metric values to/from their JSON representation,
+# any datatype missing from these tables is passed through unchanged
+_json_encoders: Dict[DataType, Callable[[Any], Any]] = {
+    DataType.UNKNOWN: _untyped_to_json,
+    DataType.FLOAT: _float_to_json,
+    DataType.DOUBLE: _float_to_json,
+    DataType.FLOAT_ARRAY: _float_array_to_json,
+    DataType.DOUBLE_ARRAY: _float_array_to_json,
+    DataType.DATASET: _dataset_to_json,
+    DataType.BYTES: _bytes_to_json,
+    DataType.FILE: _bytes_to_json,
+    DataType.DATETIME: datetime.isoformat,
+    DataType.DATETIME_ARRAY: lambda value: [ts.isoformat() for ts in value],
+    DataType.TEMPLATE: _template_to_json,
+}
+
+_json_decoders: Dict[DataType, Callable[[Any], Any]] = {
+    DataType.FLOAT: _float_from_json,
+    DataType.DOUBLE: _float_from_json,
+    DataType.FLOAT_ARRAY: _float_array_from_json,
+    DataType.DOUBLE_ARRAY: _float_array_from_json,
+    DataType.BYTES: _bytes_from_json,
+    DataType.FILE: _bytes_from_json,
+    DataType.DATETIME: datetime.fromisoformat,
+    DataType.DATETIME_ARRAY: lambda value: [datetime.fromisoformat(ts) for ts in value],
+    DataType.DATASET: _dataset_from_json,
+    DataType.TEMPLATE: _template_from_json,
+}
+
+def metric_to_json(metric: Metric) -> Dict[str, Any]:
     """Convert a Metric to a JSON-serializable dictionary."""
+    name = metric.name
+    alias = metric.alias
+    timestamp = metric.timestamp
+    dt = metric.datatype
+    is_null = metric.is_null
+    metadata = metric.metadata
+    value = metric.value
     result: Dict[str, Any] = {}
     
-    if metric.name is not None:
-        result["name"] = metric.name
-    if metric.alias is not None:
-        result["alias"] = metric.alias
-    if metric.timestamp is not None:
-        result["timestamp"] = metric.timestamp
-    if metric.datatype != DataType.UNKNOWN:
-        result["datatype"] = metric.datatype.value
-    if metric.is_historical:
-        result["is_historical"] = True
-    if metric.is_transient:
-        result["is_transient"] = True
-    if metric.is_null:
-        result["is_null"] = True
-    if metric.metadata is not None:
-        result["metadata"] = metric.metadata
+    if name is not None:
+        result["name"] = name
+    if alias is not None:
+        result["alias"] = alias
+    if timestamp is not None:
+        result["timestamp"] = timestamp
+    if dt != DataType.UNKNOWN:
+        result["datatype"] = dt.value
+    is_historical = metric.is_historical
+    is_transient = metric.is_transient
+    # Flags are almost always all unset, so check them together first
+    if is_historical or is_transient or is_null:
+        if is_historical:
+            result["is_historical"] = True
+        if is_transient:
+            result["is_transient"] = True
+        if is_null:
+            result["is_null"] = True
+    if metadata is not None:
+        result["metadata"] = _metadata_to_json(metadata)
         
     # Handle value based on datatype
-    if not metric.is_null and metric.value is not None:
-        if metric.datatype == DataType.DATASET:
-            result["value"] = {
-                "num_of_columns": metric.value.num_of_columns,
-                "columns": [col.name for col in metric.value.columns],
-                "types": [col.type.value for col in metric.value.columns],
-                "rows": [[cell.value for cell in row.cells] for row in metric.value.rows]
-            }
-        elif metric.datatype == DataType.BYTES:
-            result["value"] = list(metric.value)
-        elif metric.datatype == DataType.DATETIME:
-            result["value"] = metric.value.isoformat()
-        elif metric.datatype == DataType.DATETIME_ARRAY:
-            result["value"] = [dt.isoformat() for dt in metric.value]
-        elif metric.datatype == DataType.TEMPLATE:
-            result["value"] = {
-                "version": metric.value.version,
-                "template_ref": metric.value.template_ref,
-                "is_definition": metric.value.is_definition,
-                "metrics": [metric_to_json(m, include_dtype=include_dtype) for m in metric.value.metrics],
-                "parameters": [
-                    {
-                        "name": p.name,
-                        "type": p.type.value,
-                        "value": p.value
-                    } for p in metric.value.parameters
-                ]
-            }
-        else:
-            result["value"] = metric.value
+    if not is_null and value is not None:
+        result["value"] = _json_encoders.get(dt, _identity)(value)
             
     return result
 
 def metric_from_json(data: Dict[str, Any]) -> Metric:
     """Create a Metric from a JSON dictionary."""
-    kwargs: Dict[str, Any] = {}
-    
-    if "name" in data:
-        kwargs["name"] = data["name"]
-    if "alias" in data:
-        kwargs["alias"] = data["alias"]
-    if "timestamp" in data:
-        kwargs["timestamp"] = data["timestamp"]
-    if "datatype" in data:
-        kwargs["datatype"] = DataType(data["datatype"])
-    if data.get("is_historical"):
-        kwargs["is_historical"] = True
-    if data.get("is_transient"):
-        kwargs["is_transient"] = True
-    if data.get("is_null"):
-        kwargs["is_null"] = True
-    if "metadata" in data:
-        kwargs["metadata"] = data["metadata"]
+    get = data.get
+    datatype = get("datatype")
+    dt = DataType(datatype) if datatype is not None else DataType.UNKNOWN
+    is_null = bool(get("is_null"))
+    value = get("value")
+    metadata = get("metadata")
         
     # Handle value based on datatype
-    if "value" in data and not data.get("is_null"):
-        if kwargs.get("datatype") == DataType.BYTES:
-            kwargs["value"] = bytes(data["value"])
-        elif kwargs.get("datatype") == DataType.DATETIME:
-            kwargs["value"] = datetime.fromisoformat(data["value"])
-        elif kwargs.get("datatype") == DataType.DATETIME_ARRAY:
-            kwargs["value"] = [datetime.fromisoformat(dt) for dt in data["value"]]
-        elif kwargs.get("datatype") == DataType.DATASET:
-            from pysparkplug._protobuf import DataSet, DataSetValue, Row
-            dataset = DataSet()
-            dataset.num_of_columns = data["value"]["num_of_columns"]
-            for col_name, col_type in zip(data["value"]["columns"], data["value"]["types"]):
-                col = dataset.columns.add()
-                col.name = col_name
-                col.type = col_type
-            for row_data in data["value"]["rows"]:
-                row = Row()
-                for cell_value in row_data:
-                    cell = row.cells.add()
-                    cell.value = cell_value
-                dataset.rows.append(row)
-            kwargs["value"] = dataset
-        elif kwargs.get("datatype") == DataType.TEMPLATE:
-            from pysparkplug._protobuf import Template, Parameter
-            template = Template()
-            template.version = data["value"]["version"]
-            template.template_ref = data["value"]["template_ref"]
-            template.is_definition = data["value"]["is_definition"]
-            for metric_data in data["value"]["metrics"]:
-                template.metrics.append(metric_from_json(metric_data).to_pb())
-            for param_data in data["value"]["parameters"]:
-                param = Parameter()
-                param.name = param_data["name"]
-                param.type = param_data["type"]
-                param.value = param_data["value"]
-                template.parameters.append(param)
-            kwargs["value"] = template
-        else:
-            kwargs["value"] = data["value"]
+    if value is not None and not is_null:
+        value = _json_decoders.get(dt, _identity)(value)
             
-    return Metric(**kwargs)
+    return Metric(
+        timestamp=get("timestamp"),
+        name=get("name"),
+        datatype=dt,
+        metadata=Metadata(**metadata) if metadata is not None else None,
+        value=None if is_null else value,
+        alias=get("alias"),
+        is_historical=bool(get("is_historical")),
+        is_transient=bool(get("is_transient")),
+        is_null=is_null,
+    )
 
 def payload_to_json(payload: Any, *, include_dtypes: bool = False) -> bytes:
-    """Convert a payload to JSON bytes."""
+    """Convert a payload to JSON bytes.
+
+    Known datatypes are always written to JSON, so include_dtypes is accepted
+    only to mirror the protobuf encoder's signature.
+    """
     data: Dict[str, Any] = {
         "timestamp": payload.timestamp
     }
@@ -140,17 +274,17 @@ def payload_to_json(payload: Any, *, include_dtypes: bool = False) -> bytes:
         data["seq"] = payload.seq
         
     if hasattr(payload, "metrics"):
-        data["metrics"] = [metric_to_json(m, include_dtype=include_dtypes) for m in payload.metrics]
+        data["metrics"] = [metric_to_json(m) for m in payload.metrics]
     elif hasattr(payload, "bd_seq_metric"):
-        data["bd_seq_metric"] = metric_to_json(payload.bd_seq_metric, include_dtype=include_dtypes)
+        data["bd_seq_metric"] = metric_to_json(payload.bd_seq_metric)
     elif hasattr(payload, "online"):
         data["online"] = payload.online
         
-    return json.dumps(data).encode()
+    return json_dumps(data)
 
 def payload_from_json(cls: type[Self], raw: bytes, *, birth: Optional[Any] = None) -> Self:
     """Create a payload from JSON bytes."""
-    data = json.loads(raw.decode())
+    data = json_loads(raw)
     
     kwargs: Dict[str, Any] = {
         "timestamp": data["timestamp"]
@@ -160,13 +294,20 @@ def payload_from_json(cls: type[Self], raw: bytes, *, birth: Optional[Any] = Non
         kwargs["seq"] = data["seq"]
         
     if "metrics" in data:
-        metrics = [metric_from_json(m) for m in data["metrics"]]
-        if birth is not None:
-            for metric in metrics:
-                if not metric.name and metric.alias is not None:
-                    metric.name = birth.get_name(metric.alias)
-                if metric.datatype == DataType.UNKNOWN:
-                    metric.datatype = birth.get_dtype(metric.name)
+        if birth is None:
+            metrics = [metric_from_json(m) for m in data["metrics"]]
+        else:
+            # Fill in names/datatypes from the birth before building each
+            # metric, so values are decoded with the right datatype
+            get_name = birth._names_mapping.__getitem__
+            get_dtype = birth._dtypes_mapping.__getitem__
+            metrics = []
+            for m in data["metrics"]:
+                if not m.get("name") and m.get("alias") is not None:
+                    m["name"] = get_name(m["alias"])
+                if m.get("datatype") is None:
+                    m["datatype"] = get_dtype(m["name"]).value
+                metrics.append(metric_from_json(m))
         kwargs["metrics"] = tuple(metrics)
     elif "bd_seq_metric" in data:
         kwargs["bd_seq_metric"] = metric_from_json(data["bd_seq_metric"])
@@ -1,18 +1,43 @@
 """Module defining the Message class"""
 
 import dataclasses
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
 from paho.mqtt import client as paho_mqtt
 
-from pysparkplug._enums import QoS
-from pysparkplug._payload import Birth, Payload
+from pysparkplug._enums import MessageType, QoS
+from pysparkplug._payload import Birth, Payload, _slots_getstate, _slots_setstate
 from pysparkplug._topic import Topic
 from pysparkplug._types import Self
 
 __all__ = ["Message"]
 
 
+# Payload decoder for each (message type, use_json_payload) pair, resolved once
+# up front so that decoding a message is a single dict lookup
+_decoders: dict[tuple[MessageType, bool], Callable[..., Payload]] = {
+    **{
+        (message_type, False): message_type.payload.decode
+        for message_type in MessageType
+    },
+    **{
+        (message_type, True): message_type.payload.from_json
+        for message_type in MessageType
+    },
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_topic(raw: str) -> Topic:
+    """Parse a raw topic string, reusing the Topic for recently seen strings.
+
+    Topics are frozen dataclasses, so a cached instance is safe to share
+    between messages.
+    """
+    return Topic.from_str(raw)
+
+
 @dataclasses.dataclass(frozen=True)
 class Message:
     """Class representing a Sparkplug B message
@@ -29,11 +54,17 @@ class Message:
             "last known good"/retained message for the topic
     """
 
+    # Declared by hand rather than via dataclass(slots=True) to support Python 3.9
+    __slots__ = ("payload", "qos", "retain", "topic")
+
     topic: Topic
     payload: Payload
     qos: QoS
     retain: bool
 
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+
     @classmethod
     def from_mqtt_message(
         cls, mqtt_message: paho_mqtt.MQTTMessage, *, birth: Optional[Birth] = None, use_json_payload: bool = False
@@ -49,11 +80,11 @@ class Message:
             use_json_payload:
                 whether to use JSON encoding/decoding
         """
-        topic = Topic.from_str(mqtt_message.topic)
+        topic = _parse_topic(mqtt_message.topic)
         # We have to ignore some mypy here since we know that mqtt gives us a
         # fully defined topic, i.e. no wildcards.
-        payload_cls = topic.message_type.payload
-        payload = payload_cls.from_json(mqtt_message.payload, birth=birth) if use_json_payload else payload_cls.decode(mqtt_message.payload, birth=birth)
+        decode = _decoders[(topic.message_type, use_json_payload)]  # type: ignore[index]
+        payload = decode(mqtt_message.payload, birth=birth)
         return cls(
             topic=topic,
             payload=payload,
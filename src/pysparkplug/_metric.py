@@ -1,7 +1,7 @@
 """Module defining the Metric dataclass"""
 
 import dataclasses
-from typing import Optional
+from typing import Iterable, Optional
 
 from pysparkplug._datatype import DataType
 from pysparkplug._metadata import Metadata
@@ -105,3 +105,29 @@ class Metric:
             if metric.HasField("metadata")
             else None,
         )
+
+    @classmethod
+    def from_pb_batch(cls, metrics: Iterable[PB_Metric]) -> tuple[Self, ...]:  # type: ignore[reportInvalidTypeForm]
+        """Constructs Metric objects from many Protobuf metrics at once
+
+        Args:
+            metrics: the Protobuf metrics to construct from
+
+        Returns:
+            a tuple of Metric objects
+        """
+        return tuple(map(cls.from_pb, metrics))
+
+    @staticmethod
+    def to_pb_batch(
+        metrics: Iterable["Metric"], include_dtype: bool
+    ) -> list[PB_Metric]:  # type: ignore[reportInvalidTypeForm]
+        """Returns Protobuf metrics for many Metric objects at once
+
+        Args:
+            metrics:
+                the Metric objects to convert
+            include_dtype:
+                whether or not to include dtypes in the Protobuf metrics
+        """
+        return [metric.to_pb(include_dtype) for metric in metrics]
@@ -3,15 +3,14 @@
 from __future__ import annotations
 
 import dataclasses
-import json
 from abc import abstractmethod
-from typing import Optional, Protocol, cast, runtime_checkable
+from typing import TYPE_CHECKING, Iterable, Optional, Protocol
 
 from pysparkplug import _protobuf as protobuf
 from pysparkplug._datatype import DataType
 from pysparkplug._metric import Metric
 from pysparkplug._types import Self
-from pysparkplug._json_payload import payload_from_json, payload_to_json, metric_from_json, metric_to_json
+from pysparkplug._json_payload import json_dumps, json_loads, payload_from_json, payload_to_json, metric_from_json, metric_to_json
 
 __all__ = [
     "DBirth",
@@ -26,7 +25,25 @@ __all__ = [
 ]
 
 
-@runtime_checkable
+# Bound once so each decode pays a single global lookup rather than
+# resolving the module, class and method every call. Encoders and decoders
+# always build a fresh protobuf Payload: upb allocates submessages from the
+# message's arena and Clear() doesn't release them, so reusing one grows
+# without bound while saving nothing per call
+_parse_payload = protobuf.Payload.FromString
+_metric_from_pb = Metric.from_pb
+
+
+def _slots_getstate(self: object) -> tuple[object, ...]:
+    return tuple([getattr(self, field.name) for field in dataclasses.fields(self)])  # type: ignore[arg-type]
+
+
+def _slots_setstate(self: object, state: tuple[object, ...]) -> None:
+    # Frozen dataclasses block __setattr__, so restore slots directly
+    for field, value in zip(dataclasses.fields(self), state):  # type: ignore[arg-type]
+        object.__setattr__(self, field.name, value)
+
+
 class Payload(Protocol):
     """Protocol defining the methods a payload should have"""
 
@@ -92,12 +109,17 @@ class Payload(Protocol):
 
 
 class _BasePayload:
-    @classmethod
-    def decode(cls, raw: bytes, *, birth: Optional[Birth] = None) -> Self:
-        return cls._decode_protobuf(raw, birth=birth)
+    __slots__ = ()
 
-    def encode(self, *, include_dtypes: bool = False) -> bytes:
-        return self._encode_protobuf(include_dtypes=include_dtypes)
+    if TYPE_CHECKING:
+        # Declared by the dataclass subclasses, which the shared codecs construct
+        timestamp: int
+        metrics: tuple[Metric, ...]
+
+        def __init__(self, *, timestamp: int, metrics: tuple[Metric, ...]) -> None: ...
+
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
 
     def to_json(self, *, include_dtypes: bool = False) -> bytes:
         return payload_to_json(self, include_dtypes=include_dtypes)
@@ -108,34 +130,88 @@ class _BasePayload:
 
     @classmethod
     def _decode_protobuf(cls, raw: bytes, *, birth: Optional[Birth] = None) -> Self:
-        payload = protobuf.Payload.FromString(raw)
-        if birth:
-            for metric in payload.metrics:
-                if not metric.name:
-                    metric.name = birth.get_name(metric.alias)
-                if metric.datatype == DataType.UNKNOWN:
-                    metric.datatype = birth.get_dtype(metric.name)
-        kwargs = {
-            "timestamp": payload.timestamp,
-            "metrics": tuple(Metric.from_pb(m) for m in payload.metrics),
-        }
-        if payload.HasField("seq"):
-            kwargs["seq"] = payload.seq
-        return cls(**kwargs)
+        payload = _parse_payload(raw)
+        return cls(
+            timestamp=payload.timestamp,
+            metrics=_decode_metrics(payload.metrics, birth),
+        )
 
     def _encode_protobuf(self, *, include_dtypes: bool = False) -> bytes:
         payload = protobuf.Payload()
         payload.timestamp = self.timestamp
-        if hasattr(self, "seq"):
-            payload.seq = self.seq
-        payload.metrics.extend(
-            metric.to_pb(include_dtype=include_dtypes) for metric in self.metrics
+        payload.metrics.extend(Metric.to_pb_batch(self.metrics, include_dtypes))
+        return payload.SerializeToString()
+
+    # Protobuf is the native wire format, so decode/encode are bound to the
+    # protobuf implementations at class creation instead of forwarding to them
+    decode = _decode_protobuf
+    encode = _encode_protobuf
+
+
+class _SeqPayload(_BasePayload):
+    """Base for payloads that always carry a sequence number, i.e. Births and Datas"""
+
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        seq: int
+
+        def __init__(
+            self, *, timestamp: int, seq: int, metrics: tuple[Metric, ...]
+        ) -> None: ...
+
+    @classmethod
+    def _decode_protobuf(cls, raw: bytes, *, birth: Optional[Birth] = None) -> Self:
+        payload = _parse_payload(raw)
+        return cls(
+            timestamp=payload.timestamp,
+            seq=payload.seq,
+            metrics=_decode_metrics(payload.metrics, birth),
         )
-        return cast(bytes, payload.SerializeToString())
+
+    def _encode_protobuf(self, *, include_dtypes: bool = False) -> bytes:
+        payload = protobuf.Payload()
+        payload.timestamp = self.timestamp
+        payload.seq = self.seq
+        payload.metrics.extend(Metric.to_pb_batch(self.metrics, include_dtypes))
+        return payload.SerializeToString()
+
+    decode = _decode_protobuf
+    encode = _encode_protobuf
+
+
+def _decode_metrics(
+    pb_metrics: Iterable[protobuf.Metric],  # type: ignore[reportInvalidTypeForm]
+    birth: Optional[Birth],
+) -> tuple[Metric, ...]:
+    """Converts protobuf metrics, filling in names/datatypes from the birth"""
+    if not birth:
+        return Metric.from_pb_batch(pb_metrics)
+    # Fill in names/datatypes from the birth in the same pass that
+    # converts each metric, so the repeated field is only walked once
+    # Index the birth's mappings directly, skipping the get_name/get_dtype frames
+    get_name = birth._names_mapping.__getitem__
+    get_dtype = birth._dtypes_mapping.__getitem__
+    from_pb = _metric_from_pb
+    unknown = DataType.UNKNOWN
+    metrics = []
+    for metric in pb_metrics:
+        if not metric.name:
+            metric.name = get_name(metric.alias)
+        if metric.datatype == unknown:
+            metric.datatype = get_dtype(metric.name)
+        metrics.append(from_pb(metric))
+    return tuple(metrics)
+
+
+class _BirthMappingSlots(_SeqPayload):
+    # Slots for Birth's derived mappings. On Python < 3.10 a dataclass field
+    # can't share a class with its own __slots__ entry, so they live here
+    __slots__ = ("_dtypes_mapping", "_names_mapping")
 
 
 @dataclasses.dataclass(frozen=True)
-class Birth(_BasePayload):
+class Birth(_BirthMappingSlots):
     """Class representing a Birth payload
 
     Args:
@@ -147,30 +223,45 @@ class Birth(_BasePayload):
             metrics associated with this payload
     """
 
+    __slots__ = ("metrics", "seq", "timestamp")
+
     timestamp: int
     seq: int
     metrics: tuple[Metric, ...]
+    # Derived from metrics in __post_init__
     _names_mapping: dict[int, str] = dataclasses.field(
-        init=False, default_factory=dict, repr=False
+        init=False, repr=False, compare=False
     )
     _dtypes_mapping: dict[str, DataType] = dataclasses.field(
-        init=False, default_factory=dict, repr=False
+        init=False, repr=False, compare=False
     )
 
     def __post_init__(self) -> None:
         """Validates payload"""
-        for metric in self.metrics:
-            if metric.name is None:
-                raise ValueError(
-                    f"Metric {metric} must have a defined name when provided to a Birth payload"
-                )
-            if metric.datatype == DataType.UNKNOWN:
-                raise ValueError(
-                    f"Metric {metric} must have a defined datatype when provided to a Birth payload"
-                )
-            if metric.alias is not None:
-                self._names_mapping[metric.alias] = metric.name
-            self._dtypes_mapping[metric.name] = metric.datatype
+        metrics = self.metrics
+        unknown = DataType.UNKNOWN
+        # Checked over the metrics themselves, since duplicate names would
+        # collapse in the mappings and could hide an invalid metric
+        if any(metric.name is None or metric.datatype == unknown for metric in metrics):
+            for metric in metrics:
+                if metric.name is None:
+                    raise ValueError(
+                        f"Metric {metric} must have a defined name when provided to a Birth payload"
+                    )
+                if metric.datatype == DataType.UNKNOWN:
+                    raise ValueError(
+                        f"Metric {metric} must have a defined datatype when provided to a Birth payload"
+                    )
+        object.__setattr__(
+            self,
+            "_dtypes_mapping",
+            {metric.name: metric.datatype for metric in metrics},
+        )
+        object.__setattr__(
+            self,
+            "_names_mapping",
+            {metric.alias: metric.name for metric in metrics if metric.alias is not None},
+        )
 
     @classmethod
     def decode(cls, raw: bytes, *, birth: Optional[Birth] = None) -> Self:
@@ -238,6 +329,8 @@ class NBirth(Birth):
             metrics associated with this payload
     """
 
+    __slots__ = ()
+
 
 class DBirth(Birth):
     """Class representing a DBirth payload
@@ -251,9 +344,13 @@ class DBirth(Birth):
             metrics associated with this payload
     """
 
+    __slots__ = ()
+
 
 @dataclasses.dataclass(frozen=True)
-class _Data(_BasePayload):
+class _Data(_SeqPayload):
+    __slots__ = ("metrics", "seq", "timestamp")
+
     timestamp: int
     seq: int
     metrics: tuple[Metric, ...]
@@ -271,6 +368,8 @@ class NData(_Data):
             metrics associated with this payload
     """
 
+    __slots__ = ()
+
 
 class DData(_Data):
     """Class representing a DData payload
@@ -284,9 +383,13 @@ class DData(_Data):
             metrics associated with this payload
     """
 
+    __slots__ = ()
+
 
 @dataclasses.dataclass(frozen=True)
 class _Cmd(_BasePayload):
+    __slots__ = ("metrics", "timestamp")
+
     timestamp: int
     metrics: tuple[Metric, ...]
 
@@ -301,6 +404,8 @@ class NCmd(_Cmd):
             metrics associated with this payload
     """
 
+    __slots__ = ()
+
 
 class DCmd(_Cmd):
     """Class representing a DCmd payload
@@ -312,6 +417,8 @@ class DCmd(_Cmd):
             metrics associated with this payload
     """
 
+    __slots__ = ()
+
 
 @dataclasses.dataclass(frozen=True)
 class NDeath:
@@ -324,9 +431,14 @@ class NDeath:
             birth death sequence number metric
     """
 
+    __slots__ = ("bd_seq_metric", "timestamp")
+
     timestamp: Optional[int]
     bd_seq_metric: Metric
 
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+
     @classmethod
     def decode(
         cls,
@@ -345,10 +457,12 @@ class NDeath:
         Returns:
             NDeath object
         """
-        payload = protobuf.Payload.FromString(raw)
+        # A full parse is kept on purpose: the upb backend parses these tiny
+        # payloads in C faster than a Python-level varint walk could
+        payload = _parse_payload(raw)
         return cls(
-            timestamp=payload.timestamp if not payload.HasField("timestamp") else None,
-            bd_seq_metric=Metric.from_pb(payload.metrics[0]),
+            timestamp=payload.timestamp if payload.HasField("timestamp") else None,
+            bd_seq_metric=_metric_from_pb(payload.metrics[0]),
         )
 
     def encode(self, *, include_dtypes: bool = False) -> bytes:
@@ -366,7 +480,7 @@ class NDeath:
         if self.timestamp is not None:
             payload.timestamp = self.timestamp
         payload.metrics.append(self.bd_seq_metric.to_pb(include_dtype=include_dtypes))
-        return cast(bytes, payload.SerializeToString())
+        return payload.SerializeToString()
 
     def to_json(self, *, include_dtypes: bool = False) -> bytes:
         """Encode NDeath object into JSON bytes
@@ -380,9 +494,9 @@ class NDeath:
         """
         data = {
             "timestamp": self.timestamp,
-            "bd_seq_metric": metric_to_json(self.bd_seq_metric, include_dtype=True)
+            "bd_seq_metric": metric_to_json(self.bd_seq_metric)
         }
-        return json.dumps(data).encode()
+        return json_dumps(data)
 
     @classmethod
     def from_json(cls, raw: bytes, *, birth: Optional[Birth] = None) -> Self:
@@ -397,7 +511,7 @@ class NDeath:
         Returns:
             NDeath object
         """
-        data = json.loads(raw.decode())
+        data = json_loads(raw)
         return cls(
             timestamp=data["timestamp"],
             bd_seq_metric=metric_from_json(data["bd_seq_metric"])
@@ -415,9 +529,14 @@ class DDeath:
             sequence number
     """
 
+    __slots__ = ("seq", "timestamp")
+
     timestamp: int
     seq: int
 
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+
     @classmethod
     def decode(
         cls,
@@ -436,7 +555,7 @@ class DDeath:
         Returns:
             DDeath object
         """
-        payload = protobuf.Payload.FromString(raw)
+        payload = _parse_payload(raw)
         return cls(
             timestamp=payload.timestamp,
             seq=payload.seq,
@@ -455,7 +574,7 @@ class DDeath:
         payload = protobuf.Payload()
         payload.timestamp = self.timestamp
         payload.seq = self.seq
-        return cast(bytes, payload.SerializeToString())
+        return payload.SerializeToString()
 
     def to_json(self, *, include_dtypes: bool = False) -> bytes:
         """Encode DDeath object into JSON bytes
@@ -471,7 +590,7 @@ class DDeath:
             "timestamp": self.timestamp,
             "seq": self.seq
         }
-        return json.dumps(data).encode()
+        return json_dumps(data)
 
     @classmethod
     def from_json(cls, raw: bytes, *, birth: Optional[Birth] = None) -> Self:
@@ -486,7 +605,7 @@ class DDeath:
         Returns:
             DDeath object
         """
-        data = json.loads(raw.decode())
+        data = json_loads(raw)
         return cls(
             timestamp=data["timestamp"],
             seq=data["seq"]
@@ -504,9 +623,14 @@ class State:
             whether or not the primary host application is online
     """
 
+    __slots__ = ("online", "timestamp")
+
     timestamp: int
     online: bool
 
+    __getstate__ = _slots_getstate
+    __setstate__ = _slots_setstate
+
     @classmethod
     def decode(
         cls,
@@ -525,7 +649,7 @@ class State:
         Returns:
             State object
         """
-        state = json.loads(raw)
+        state = json_loads(raw)
         return cls(
             timestamp=state["timestamp"],
             online=state["online"],
@@ -553,7 +677,7 @@ class State:
         Returns:
             encoded payload in JSON bytes
         """
-        return json.dumps({"timestamp": self.timestamp, "online": self.online}).encode()
+        return json_dumps({"timestamp": self.timestamp, "online": self.online})
 
     @classmethod
     def from_json(cls, raw: bytes, *, birth: Optional[Birth] = None) -> Self:
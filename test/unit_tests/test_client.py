@@ -0,0 +1,51 @@
+"""Unit tests for Client class"""
+
+import unittest
+from unittest import mock
+
+from pysparkplug import Client, DataType, MessageType, Metric, NCmd, QoS, Topic
+from pysparkplug._message import Message
+
+
+def _message(edge_node_id: str) -> Message:
+    return Message(
+        topic=Topic(
+            message_type=MessageType.NCMD, group_id="group", edge_node_id=edge_node_id
+        ),
+        payload=NCmd(
+            timestamp=1234567890,
+            metrics=(
+                Metric(
+                    timestamp=1234567890,
+                    name="reboot",
+                    datatype=DataType.BOOLEAN,
+                    value=True,
+                ),
+            ),
+        ),
+        qos=QoS.AT_LEAST_ONCE,
+        retain=False,
+    )
+
+
+class TestClient(unittest.TestCase):
+    """Test Client functionality"""
+
+    def test_publish_many(self):
+        """Test publish_many makes one MQTT publish per message, in order"""
+        client = Client()
+        client._client = mock.Mock()
+        client._client.publish.return_value.rc = 0
+        messages = [_message("node_1"), _message("node_2")]
+
+        client.publish_many(messages, include_dtypes=True)
+
+        calls = client._client.publish.call_args_list
+        self.assertEqual(
+            [call.kwargs["topic"] for call in calls],
+            ["spBv1.0/group/NCMD/node_1", "spBv1.0/group/NCMD/node_2"],
+        )
+        for call, message in zip(calls, messages):
+            self.assertEqual(
+                call.kwargs["payload"], message.payload.encode(include_dtypes=True)
+            )
@@ -0,0 +1,74 @@
+"""Unit tests for DataOpsNode class"""
+
+import unittest
+from unittest import mock
+
+from pysparkplug import Client, DataType, MessageType, Metric, NBirth, NData, Topic
+from pysparkplug._data_ops_node import DataOpsNode
+
+
+def _metric(name: str, value: int) -> Metric:
+    return Metric(timestamp=1234567890, name=name, datatype=DataType.INT32, value=value)
+
+
+class TestDataOpsNode(unittest.TestCase):
+    """Test DataOpsNode functionality"""
+
+    def setUp(self):
+        self.client = mock.create_autospec(Client, instance=True)
+        self.node = DataOpsNode(
+            "data_ops", client=self.client, timestamp_provider=lambda: 1234567890
+        )
+        self.topic = Topic(
+            message_type=MessageType.NDATA, group_id="group", edge_node_id="node"
+        )
+
+    def _published_payloads(self):
+        return [call.args[0].payload for call in self.client.publish.call_args_list]
+
+    def test_first_batch_publishes_nbirth(self):
+        """Test the first batch births the node with the latest value per metric"""
+        self.node.publish_batch(
+            self.topic,
+            [[_metric("a", 1), _metric("b", 2)], [_metric("a", 3)]],
+        )
+
+        (payload,) = self._published_payloads()
+        self.assertIsInstance(payload, NBirth)
+        self.assertEqual(
+            [(metric.name, metric.value) for metric in payload.metrics],
+            [("a", 3), ("b", 2)],
+        )
+
+    def test_published_nbirth_is_not_mutated(self):
+        """Test later publishes don't change an NBIRTH that was already sent"""
+        self.node.publish_batch(self.topic, [[_metric("a", 1)]])
+        self.node.publish(self.topic, [_metric("a", 2), _metric("b", 3)])
+
+        nbirth = self._published_payloads()[0]
+        self.assertEqual(
+            [(metric.name, metric.value) for metric in nbirth.metrics], [("a", 1)]
+        )
+        hash(nbirth)
+
+    def test_later_batches_publish_one_ndata(self):
+        """Test batches after the birth are sent as a single NDATA"""
+        self.node.publish_batch(self.topic, [[_metric("a", 1)]])
+        self.node.publish_batch(
+            self.topic, [[_metric("a", 2)], [_metric("b", 3), _metric("a", 4)]]
+        )
+
+        payloads = self._published_payloads()
+        self.assertEqual(len(payloads), 2)
+        self.assertIsInstance(payloads[1], NData)
+        self.assertEqual(
+            [(metric.name, metric.value) for metric in payloads[1].metrics],
+            [("a", 2), ("b", 3), ("a", 4)],
+        )
+
+    def test_empty_batch_is_noop(self):
+        """Test publishing no metrics sends nothing"""
+        self.node.publish_batch(self.topic, [])
+        self.node.publish_batch(self.topic, [[], []])
+
+        self.client.publish.assert_not_called()
@@ -0,0 +1,75 @@
+"""Unit tests for HostApplication class"""
+
+import unittest
+from unittest import mock
+
+from pysparkplug import (
+    Client,
+    DataType,
+    DCmd,
+    HostApplication,
+    MessageType,
+    Metric,
+    NCmd,
+)
+
+
+def _metrics():
+    return [
+        Metric(timestamp=1234567890, name="reboot", datatype=DataType.BOOLEAN, value=True)
+    ]
+
+
+class TestHostApplication(unittest.TestCase):
+    """Test HostApplication functionality"""
+
+    def setUp(self):
+        self.client = mock.create_autospec(Client, instance=True)
+        self.host = HostApplication("host", client=self.client)
+
+    def _published_messages(self):
+        (call,) = self.client.publish_many.call_args_list
+        return list(call.args[0])
+
+    def test_send_node_commands(self):
+        """Test one NCMD is sent per Edge Node"""
+        self.host.send_node_commands(
+            {"node_1": _metrics(), "node_2": _metrics()}, group_id="group"
+        )
+
+        messages = self._published_messages()
+        self.assertEqual(
+            [str(message.topic) for message in messages],
+            ["spBv1.0/group/NCMD/node_1", "spBv1.0/group/NCMD/node_2"],
+        )
+        for message in messages:
+            self.assertIsInstance(message.payload, NCmd)
+            self.assertEqual(message.payload.metrics, tuple(_metrics()))
+
+    def test_send_device_commands(self):
+        """Test one DCMD is sent per Device"""
+        self.host.send_device_commands(
+            "node", {"device_1": _metrics(), "device_2": _metrics()}, group_id="group"
+        )
+
+        messages = self._published_messages()
+        self.assertEqual(
+            [str(message.topic) for message in messages],
+            ["spBv1.0/group/DCMD/node/device_1", "spBv1.0/group/DCMD/node/device_2"],
+        )
+        for message in messages:
+            self.assertIsInstance(message.payload, DCmd)
+
+    def test_own_state_not_subscribed_by_default(self):
+        """Test a Host doesn't subscribe to its own STATE topic unless asked"""
+        self.client.subscribe.assert_not_called()
+
+    def test_subscribe_own_state(self):
+        """Test subscribe_own_state subscribes to the Host's own STATE topic"""
+        client = mock.create_autospec(Client, instance=True)
+        HostApplication("host", client=client, subscribe_own_state=True)
+
+        (call,) = client.subscribe.call_args_list
+        topic = call.args[0]
+        self.assertEqual(topic.message_type, MessageType.STATE)
+        self.assertEqual(topic.sparkplug_host_id, "host")
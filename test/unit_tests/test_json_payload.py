@@ -0,0 +1,242 @@
+"""Unit tests for JSON payload encoding"""
+
+import math
+import unittest
+from typing import Any, Callable, Iterator
+from unittest import mock
+
+from pysparkplug import DataType, Metadata, Metric, NBirth, NData, NDeath, _json_payload
+from pysparkplug._json_payload import metric_from_json
+from pysparkplug._protobuf import DataSet, DataSetValue, Parameter, Row, Template
+
+_Backend = tuple[str, Callable[[Any], bytes], Callable[[bytes], Any]]
+
+
+def _json_backends() -> list[_Backend]:
+    """Returns the name, dumps and loads of each available JSON backend"""
+    backends: list[_Backend] = [
+        ("json", _json_payload._stdlib_json_dumps, _json_payload._stdlib_json_loads)
+    ]
+    try:
+        import orjson
+    except ImportError:
+        return backends
+    # With orjson installed, the module's json_loads is its orjson-backed loader
+    backends.append(("orjson", orjson.dumps, _json_payload.json_loads))
+    return backends
+
+
+def _use_backend(
+    dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]
+) -> Any:
+    return mock.patch.multiple(_json_payload, json_dumps=dumps, json_loads=loads)
+
+
+class TestJsonPayload(unittest.TestCase):
+    """Test JSON payload functionality"""
+
+    def _cross_decode(self, payload: NData) -> Iterator[NData]:
+        """Yields the payload as encoded by each backend and decoded by each backend"""
+        for writer, dumps, writer_loads in _json_backends():
+            with _use_backend(dumps, writer_loads):
+                raw = payload.to_json()
+            for reader, reader_dumps, loads in _json_backends():
+                with self.subTest(writer=writer, reader=reader), _use_backend(
+                    reader_dumps, loads
+                ):
+                    yield type(payload).from_json(raw)
+
+    def test_dataset_round_trip(self):
+        """Test DATASET metrics survive a JSON round trip"""
+        dataset = DataSet(
+            num_of_columns=2,
+            columns=["count", "label"],
+            types=[DataType.INT32, DataType.STRING],
+        )
+        dataset.rows.extend(
+            [
+                Row(elements=[DataSetValue(int_value=1), DataSetValue(string_value="a")]),
+                Row(elements=[DataSetValue(int_value=2), DataSetValue()]),
+            ]
+        )
+        payload = NData(
+            timestamp=1234567890,
+            seq=0,
+            metrics=(
+                Metric(
+                    timestamp=1234567890,
+                    name="table",
+                    datatype=DataType.DATASET,
+                    value=dataset,
+                ),
+            ),
+        )
+
+        decoded = NData.from_json(payload.to_json())
+        self.assertEqual(decoded.metrics[0].value, dataset)
+
+    def test_bytes_round_trip(self):
+        """Test BYTES metrics are base64 encoded and survive a JSON round trip"""
+        payload = NData(
+            timestamp=1234567890,
+            seq=0,
+            metrics=(
+                Metric(
+                    timestamp=1234567890,
+                    name="blob",
+                    datatype=DataType.BYTES,
+                    value=b"\x00\xffsparkplug",
+                ),
+            ),
+        )
+
+        raw = payload.to_json()
+        self.assertIn(b'"AP9zcGFya3BsdWc="', raw)
+        decoded = NData.from_json(raw)
+        self.assertEqual(decoded.metrics[0].value, b"\x00\xffsparkplug")
+
+    def test_bytes_legacy_int_list(self):
+        """Test BYTES values encoded as a list of ints can still be decoded"""
+        metric = metric_from_json(
+            {"name": "blob", "datatype": DataType.BYTES.value, "value": [0, 255, 97]}
+        )
+        self.assertEqual(metric.value, b"\x00\xffa")
+
+    def test_template_round_trip(self):
+        """Test TEMPLATE metrics survive a JSON round trip"""
+        template = Template(
+            version="1.0",
+            template_ref="Motor",
+            is_definition=False,
+            metrics=[
+                Metric(
+                    timestamp=1234567890,
+                    name="rpm",
+                    datatype=DataType.INT32,
+                    value=-42,
+                ).to_pb(include_dtype=True),
+            ],
+            parameters=[
+                Parameter(name="vendor", type=DataType.STRING, string_value="ACME"),
+                Parameter(name="rating", type=DataType.DOUBLE),
+            ],
+        )
+        payload = NData(
+            timestamp=1234567890,
+            seq=0,
+            metrics=(
+                Metric(
+                    timestamp=1234567890,
+                    name="motor",
+                    datatype=DataType.TEMPLATE,
+                    value=template,
+                ),
+            ),
+        )
+
+        decoded = NData.from_json(payload.to_json())
+        self.assertEqual(decoded.metrics[0].value, template)
+
+    def test_birth_fills_alias_and_dtype(self):
+        """Test JSON payloads recover names and dtypes from the Birth"""
+        birth = NBirth(
+            timestamp=1234567890,
+            seq=0,
+            metrics=(
+                Metric(
+                    timestamp=1234567890,
+                    name="raw",
+                    datatype=DataType.BYTES,
+                    value=b"\x00",
+                    alias=3,
+                ),
+            ),
+        )
+        raw = b'{"timestamp": 1234567891, "seq": 1, "metrics": [{"alias": 3, "value": "AQI="}]}'
+
+        decoded = NData.from_json(raw, birth=birth)
+        self.assertEqual(decoded.metrics[0].name, "raw")
+        self.assertEqual(decoded.metrics[0].datatype, DataType.BYTES)
+        self.assertEqual(decoded.metrics[0].value, b"\x01\x02")
+
+    def test_non_finite_floats_round_trip(self):
+        """Test NaN and infinities survive a JSON round trip with every backend"""
+        payload = NData(
+            timestamp=1234567890,
+            seq=0,
+            metrics=(
+                Metric(timestamp=1, name="nan", datatype=DataType.DOUBLE, value=math.nan),
+                Metric(timestamp=1, name="inf", datatype=DataType.FLOAT, value=math.inf),
+                Metric(timestamp=1, name="-inf", datatype=DataType.DOUBLE, value=-math.inf),
+                Metric(
+                    timestamp=1,
+                    name="array",
+                    datatype=DataType.DOUBLE_ARRAY,
+                    value=(1.5, math.nan, -math.inf),
+                ),
+            ),
+        )
+        for decoded in self._cross_decode(payload):
+            nan, inf, neg_inf, array = decoded.metrics
+            self.assertTrue(math.isnan(nan.value))  # type: ignore[arg-type]
+            self.assertFalse(nan.is_null)
+            self.assertEqual(inf.value, math.inf)
+            self.assertEqual(neg_inf.value, -math.inf)
+            self.assertEqual(array.value[0], 1.5)  # type: ignore[index]
+            self.assertTrue(math.isnan(array.value[1]))  # type: ignore[index]
+            self.assertEqual(array.value[2], -math.inf)  # type: ignore[index]
+
+    def test_stdlib_non_finite_literals_decode(self):
+        """Test NaN/Infinity literals written by stdlib json decode with every backend"""
+        raw = (
+            b'{"timestamp": 1234567890, "seq": 0, "metrics": ['
+            b'{"name": "nan", "datatype": 10, "value": NaN}, '
+            b'{"name": "inf", "datatype": 10, "value": Infinity}]}'
+        )
+        for backend, dumps, loads in _json_backends():
+            with self.subTest(backend=backend), _use_backend(dumps, loads):
+                nan, inf = NData.from_json(raw).metrics
+                self.assertTrue(math.isnan(nan.value))  # type: ignore[arg-type]
+                self.assertEqual(inf.value, math.inf)
+
+    def test_untyped_non_finite_float_rejected(self):
+        """Test a non-finite value without a datatype is rejected with every backend"""
+        payload = NData(
+            timestamp=1234567890,
+            seq=0,
+            metrics=(
+                Metric(timestamp=1, name="nan", datatype=DataType.UNKNOWN, value=math.nan),
+            ),
+        )
+        for backend, dumps, loads in _json_backends():
+            with self.subTest(backend=backend), _use_backend(dumps, loads):
+                with self.assertRaises(ValueError):
+                    payload.to_json()
+
+    def test_metadata_round_trip(self):
+        """Test metric metadata survives a JSON round trip with every backend"""
+        payload = NData(
+            timestamp=1234567890,
+            seq=0,
+            metrics=(
+                Metric(
+                    timestamp=1234567890,
+                    name="file",
+                    datatype=DataType.BYTES,
+                    value=b"\x00\x01",
+                    metadata=Metadata(content_type="application/octet-stream", size=2),
+                ),
+            ),
+        )
+        for decoded in self._cross_decode(payload):
+            self.assertEqual(decoded, payload)
+
+    def test_ndeath_without_timestamps_round_trip(self):
+        """Test an NDeath and its bdSeq metric survive JSON without timestamps"""
+        ndeath = NDeath(
+            timestamp=None,
+            bd_seq_metric=Metric(
+                timestamp=None, name="bdSeq", datatype=DataType.INT64, value=3
+            ),
+        )
+        self.assertEqual(NDeath.from_json(ndeath.to_json()), ndeath)
@@ -0,0 +1,105 @@
+"""Unit tests for the Message class"""
+
+import pickle
+import unittest
+
+from paho.mqtt import client as paho_mqtt
+
+from pysparkplug import DataType, Message, Metric, NBirth, NData, QoS, Topic
+
+TOPIC = "spBv1.0/my_group_id/NDATA/my_edge_node_id"
+
+
+def _birth():
+    return NBirth(
+        timestamp=1234567890,
+        seq=0,
+        metrics=(
+            Metric(
+                timestamp=1234567890,
+                name="temperature",
+                datatype=DataType.DOUBLE,
+                value=21.5,
+                alias=1,
+            ),
+        ),
+    )
+
+
+def _mqtt_message(payload: bytes) -> paho_mqtt.MQTTMessage:
+    mqtt_message = paho_mqtt.MQTTMessage(topic=TOPIC.encode())
+    mqtt_message.payload = payload
+    mqtt_message.qos = 1
+    return mqtt_message
+
+
+class TestMessage(unittest.TestCase):
+    """Test Message construction and pickling"""
+
+    def test_from_mqtt_message(self):
+        """Test protobuf and JSON MQTT messages decode with and without a Birth"""
+        named = NData(
+            timestamp=1234567891,
+            seq=1,
+            metrics=(
+                Metric(
+                    timestamp=1234567891,
+                    name="temperature",
+                    datatype=DataType.DOUBLE,
+                    value=22.0,
+                ),
+            ),
+        )
+        aliased = NData(
+            timestamp=1234567891,
+            seq=1,
+            metrics=(
+                Metric(
+                    timestamp=1234567891,
+                    name=None,
+                    datatype=DataType.DOUBLE,
+                    value=22.0,
+                    alias=1,
+                ),
+            ),
+        )
+        expected = NData(
+            timestamp=1234567891,
+            seq=1,
+            metrics=(
+                Metric(
+                    timestamp=1234567891,
+                    name="temperature",
+                    datatype=DataType.DOUBLE,
+                    value=22.0,
+                    alias=1,
+                ),
+            ),
+        )
+        cases = {
+            "protobuf": (named.encode(include_dtypes=True), False, None, named),
+            "protobuf with birth": (aliased.encode(), False, _birth(), expected),
+            "json": (named.to_json(include_dtypes=True), True, None, named),
+            "json with birth": (aliased.to_json(), True, _birth(), expected),
+        }
+        for case, (raw, use_json_payload, birth, payload) in cases.items():
+            with self.subTest(case=case):
+                message = Message.from_mqtt_message(
+                    _mqtt_message(raw),
+                    birth=birth,
+                    use_json_payload=use_json_payload,
+                )
+                self.assertEqual(message.topic, Topic.from_str(TOPIC))
+                self.assertEqual(message.payload, payload)
+                self.assertEqual(message.qos, QoS.AT_LEAST_ONCE)
+                self.assertFalse(message.retain)
+
+    def test_pickle_round_trip(self):
+        """Test a Message survives pickling"""
+        message = Message(
+            topic=Topic.from_str(TOPIC),
+            payload=_birth(),
+            qos=QoS.AT_MOST_ONCE,
+            retain=True,
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(message)), message)
@@ -224,3 +224,27 @@ class TestMetric(unittest.TestCase):
         self.assertIsNone(metric2.metadata.file_type)
         self.assertIsNone(metric2.metadata.md5)
         self.assertIsNone(metric2.metadata.description)
+
+    def test_batch_conversion(self):
+        """Test batch conversion to and from protobuf metrics"""
+        metrics = (
+            Metric(
+                timestamp=1234567890,
+                name="first",
+                datatype=DataType.INT32,
+                value=1,
+            ),
+            Metric(
+                timestamp=1234567890,
+                name="second",
+                datatype=DataType.STRING,
+                value="two",
+            ),
+        )
+
+        pbs = Metric.to_pb_batch(metrics, include_dtype=True)
+        self.assertEqual([pb.name for pb in pbs], ["first", "second"])
+
+        metrics2 = Metric.from_pb_batch(pbs)
+        self.assertIsInstance(metrics2, tuple)
+        self.assertEqual(metrics2, metrics)
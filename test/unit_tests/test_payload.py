@@ -0,0 +1,169 @@
+"""Unit tests for Payload classes"""
+
+import pickle
+import sys
+import threading
+import unittest
+
+from pysparkplug import DataType, DCmd, DData, DDeath, Metric, NBirth, NData, NDeath
+from pysparkplug import _protobuf as protobuf
+
+
+def _metrics():
+    return (
+        Metric(
+            timestamp=1234567890,
+            name="temperature",
+            datatype=DataType.DOUBLE,
+            value=21.5,
+            alias=1,
+        ),
+        Metric(
+            timestamp=1234567890,
+            name="status",
+            datatype=DataType.STRING,
+            value="ok",
+            alias=2,
+        ),
+    )
+
+
+class TestPayload(unittest.TestCase):
+    """Test Payload encoding and decoding"""
+
+    def test_birth_round_trip(self):
+        """Test a Birth payload survives a protobuf round trip"""
+        birth = NBirth(timestamp=1234567890, seq=0, metrics=_metrics())
+        self.assertEqual(NBirth.decode(birth.encode()), birth)
+
+    def test_birth_rejects_incomplete_metrics(self):
+        """Test a Birth requires every metric to have a name and datatype"""
+        cases = {
+            "missing name": (
+                Metric(timestamp=1234567890, name=None, datatype=DataType.INT32, value=1),
+            ),
+            "unknown datatype": (
+                Metric(timestamp=1234567890, name="a", datatype=DataType.UNKNOWN, value=1),
+            ),
+            "duplicate name hides unknown datatype": (
+                Metric(timestamp=1234567890, name="a", datatype=DataType.UNKNOWN, value=1),
+                Metric(timestamp=1234567890, name="a", datatype=DataType.INT32, value=1),
+            ),
+        }
+        for case, metrics in cases.items():
+            with self.subTest(case=case):
+                with self.assertRaises(ValueError):
+                    NBirth(timestamp=1234567890, seq=0, metrics=metrics)
+
+    def test_data_uses_birth_for_aliases_and_dtypes(self):
+        """Test Data payloads recover names and dtypes from the Birth"""
+        birth = NBirth(timestamp=1234567890, seq=0, metrics=_metrics())
+        data = NData(
+            timestamp=1234567891,
+            seq=1,
+            metrics=(
+                Metric(
+                    timestamp=1234567891,
+                    name=None,
+                    datatype=DataType.DOUBLE,
+                    value=22.0,
+                    alias=1,
+                ),
+            ),
+        )
+
+        decoded = NData.decode(data.encode(), birth=birth)
+        self.assertEqual(decoded.seq, 1)
+        self.assertEqual(decoded.metrics[0].name, "temperature")
+        self.assertEqual(decoded.metrics[0].datatype, DataType.DOUBLE)
+        self.assertEqual(decoded.metrics[0].value, 22.0)
+
+    def test_missing_seq_decodes_as_zero(self):
+        """Test Birth and Data payloads without a seq on the wire decode with seq 0"""
+        raw = protobuf.Payload(
+            timestamp=1234567890,
+            metrics=[metric.to_pb(include_dtype=True) for metric in _metrics()],
+        ).SerializeToString()
+        for payload_cls in (NBirth, NData):
+            with self.subTest(payload_cls=payload_cls.__name__):
+                payload = payload_cls.decode(raw)
+                self.assertEqual(payload.seq, 0)
+                self.assertEqual(payload.metrics, _metrics())
+
+    def test_cmd_round_trip(self):
+        """Test a Cmd payload survives a protobuf round trip"""
+        cmd = DCmd(timestamp=1234567890, metrics=_metrics())
+        self.assertEqual(DCmd.decode(cmd.encode(include_dtypes=True)), cmd)
+
+    def test_ddeath_round_trip(self):
+        """Test a DDeath payload survives a protobuf round trip"""
+        ddeath = DDeath(timestamp=1234567890, seq=7)
+        self.assertEqual(DDeath.decode(ddeath.encode()), ddeath)
+
+    def test_ndeath_round_trip(self):
+        """Test an NDeath payload survives a protobuf round trip, with or without timestamp"""
+        bd_seq_metric = Metric(
+            timestamp=1234567890, name="bdSeq", datatype=DataType.INT64, value=3
+        )
+        for timestamp in (1234567890, None):
+            ndeath = NDeath(timestamp=timestamp, bd_seq_metric=bd_seq_metric)
+            self.assertEqual(NDeath.decode(ndeath.encode()), ndeath)
+
+    def test_pickle_round_trip(self):
+        """Test slotted payloads survive pickling, including Birth mappings"""
+        birth = NBirth(timestamp=1234567890, seq=0, metrics=_metrics())
+        unpickled = pickle.loads(pickle.dumps(birth))
+        self.assertEqual(unpickled, birth)
+        self.assertEqual(unpickled.get_name(2), "status")
+        ddeath = DDeath(timestamp=1234567890, seq=7)
+        self.assertEqual(pickle.loads(pickle.dumps(ddeath)), ddeath)
+
+    def test_encode_across_threads(self):
+        """Test encoding from several threads at once gives consistent bytes"""
+        payloads = [
+            DData(timestamp=i, seq=i % 256, metrics=_metrics()) for i in range(200)
+        ]
+        expected = [payload.encode(include_dtypes=True) for payload in payloads]
+        results = {}
+
+        def worker(index: int) -> None:
+            results[index] = [
+                payload.encode(include_dtypes=True) for payload in payloads
+            ]
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for encoded in results.values():
+            self.assertEqual(encoded, expected)
+
+    @unittest.skipIf(sys.platform == "win32", "resource module is unavailable")
+    def test_repeated_encode_memory_is_bounded(self):
+        """Test encoding in a loop doesn't accumulate memory"""
+        import resource
+
+        payload = DData(
+            timestamp=1234567890,
+            seq=0,
+            metrics=tuple(
+                Metric(
+                    timestamp=1234567890,
+                    name=f"metric_{i}",
+                    datatype=DataType.DOUBLE,
+                    value=float(i),
+                )
+                for i in range(200)
+            ),
+        )
+        payload.encode(include_dtypes=True)
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        for _ in range(2000):
+            payload.encode(include_dtypes=True)
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in KiB on Linux and bytes on macOS; a leaking encoder
+        # grows by ~45 MiB over this loop
+        growth = after - before if sys.platform != "darwin" else (after - before) // 1024
+        self.assertLess(growth, 16 * 1024)